@@ -0,0 +1 @@
+__version__ = "0.1.dev101+g991816444.d20261016"
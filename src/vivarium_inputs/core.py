@@ -1,4 +1,3 @@
-from itertools import product
 from typing import List, Optional, Union
 
 import numpy as np
@@ -16,6 +15,8 @@ from loguru import logger
 
 from vivarium_inputs import extract, utilities, utility_data
 from vivarium_inputs.globals import (
+    CAUSES_BY_ID,
+    CAUSES_BY_NAME,
     COVARIATE_VALUE_COLUMNS,
     DEMOGRAPHIC_COLUMNS,
     DISTRIBUTION_COLUMNS,
@@ -26,10 +27,12 @@ from vivarium_inputs.globals import (
     DataDoesNotExistError,
     InvalidQueryError,
     Population,
-    gbd,
 )
 from vivarium_inputs.mapping_extension import AlternativeRiskFactor, HealthcareEntity
 
+YLL_ONLY_CAUSE_IDS = {c.gbd_id for c in causes if c.restrictions.yll_only}
+DEMOGRAPHIC_AND_DRAW_COLUMNS = DEMOGRAPHIC_COLUMNS + DRAW_COLUMNS
+
 
 def get_data(
     entity: ModelableEntity,
@@ -138,7 +141,7 @@ def get_raw_incidence_rate(
         data, restrictions_entity, "yld", utility_data.get_age_group_ids()
     )
     data = utilities.normalize(data, fill_value=0)
-    data = data.filter(DEMOGRAPHIC_COLUMNS + DRAW_COLUMNS)
+    data = data.filter(DEMOGRAPHIC_AND_DRAW_COLUMNS)
     return data
 
 
@@ -181,7 +184,7 @@ def get_prevalence(
         data, restrictions_entity, "yld", utility_data.get_age_group_ids()
     )
     data = utilities.normalize(data, fill_value=0)
-    data = data.filter(DEMOGRAPHIC_COLUMNS + DRAW_COLUMNS)
+    data = data.filter(DEMOGRAPHIC_AND_DRAW_COLUMNS)
     return data
 
 
@@ -250,7 +253,7 @@ def get_disability_weight(
             data = utilities.clear_disability_weight_outside_restrictions(
                 data, cause, 0.0, utility_data.get_age_group_ids()
             )
-            data = data.filter(DEMOGRAPHIC_COLUMNS + DRAW_COLUMNS)
+            data = data.filter(DEMOGRAPHIC_AND_DRAW_COLUMNS)
         except (IndexError, DataDoesNotExistError):
             logger.warning(
                 f"{entity.name.capitalize()} has no disability weight data. All values will be 0."
@@ -277,7 +280,7 @@ def get_remission_rate(
         data, entity, "yld", utility_data.get_age_group_ids()
     )
     data = utilities.normalize(data, fill_value=0)
-    data = data.filter(DEMOGRAPHIC_COLUMNS + DRAW_COLUMNS)
+    data = data.filter(DEMOGRAPHIC_AND_DRAW_COLUMNS)
     return data
 
 
@@ -289,9 +292,8 @@ def get_cause_specific_mortality_rate(
     deaths = get_data(entity, "deaths", location_id, years=years)
     # population isn't by draws
     pop = get_data(Population(), "structure", location_id, years=years)
-    data = deaths.join(pop, lsuffix="_deaths", rsuffix="_pop")
-    data[DRAW_COLUMNS] = data[DRAW_COLUMNS].divide(data.value, axis=0)
-    return data.drop(["value"], axis="columns")
+    data = deaths.divide(pop["value"].reindex(deaths.index), axis=0)
+    return data
 
 
 def get_excess_mortality_rate(
@@ -306,8 +308,9 @@ def get_excess_mortality_rate(
         years=years,
     )
     prevalence = get_data(entity, "prevalence", location_id, years=years)
-    data = (csmr / prevalence).fillna(0)
-    data = data.replace([np.inf, -np.inf], 0)
+    data = csmr / prevalence
+    # Zero prevalence gives 0/0 or x/0 ratios; treat both as 0.
+    data = data.where(np.isfinite(data), 0)
     return data
 
 
@@ -327,7 +330,7 @@ def get_deaths(
         data, entity, "yll", utility_data.get_age_group_ids()
     )
     data = utilities.normalize(data, fill_value=0)
-    data = data.filter(DEMOGRAPHIC_COLUMNS + DRAW_COLUMNS)
+    data = data.filter(DEMOGRAPHIC_AND_DRAW_COLUMNS)
     return data
 
 
@@ -347,7 +350,7 @@ def get_exposure(
 
     if entity.name in EXTRA_RESIDUAL_CATEGORY:
         cat = EXTRA_RESIDUAL_CATEGORY[entity.name]
-        data = data.drop(labels=data.query("parameter == @cat").index)
+        data = data.loc[data.parameter != cat].copy()
         data[DRAW_COLUMNS] = data[DRAW_COLUMNS].clip(lower=MINIMUM_EXPOSURE_VALUE)
 
     if entity.kind in ["risk_factor", "alternative_risk_factor"]:
@@ -357,8 +360,9 @@ def get_exposure(
 
     if entity.distribution in ["dichotomous", "ordered_polytomous", "unordered_polytomous"]:
         tmrel_cat = utility_data.get_tmrel_category(entity)
-        exposed = data[data.parameter != tmrel_cat]
-        unexposed = data[data.parameter == tmrel_cat]
+        is_tmrel = data.parameter == tmrel_cat
+        exposed = data[~is_tmrel]
+        unexposed = data[is_tmrel]
 
         #  FIXME: We fill 1 as exposure of tmrel category, which is not correct.
         data = pd.concat(
@@ -371,12 +375,8 @@ def get_exposure(
 
         # normalize so all categories sum to 1
         cols = list(set(data.columns).difference(DRAW_COLUMNS + ["parameter"]))
-        sums = data.groupby(cols)[DRAW_COLUMNS].sum()
-        data = (
-            data.groupby("parameter")
-            .apply(lambda df: df.set_index(cols).loc[:, DRAW_COLUMNS].divide(sums))
-            .reset_index()
-        )
+        sums = data.groupby(cols)[DRAW_COLUMNS].transform("sum")
+        data[DRAW_COLUMNS] = data[DRAW_COLUMNS].divide(sums)
     else:
         data = utilities.normalize(data, fill_value=0)
     data = data.filter(DEMOGRAPHIC_COLUMNS + DRAW_COLUMNS + ["parameter"])
@@ -408,7 +408,7 @@ def get_exposure_standard_deviation(
     data = data[data.age_group_id.isin(valid_age_groups)]
 
     data = utilities.normalize(data, fill_value=0)
-    data = data.filter(DEMOGRAPHIC_COLUMNS + DRAW_COLUMNS)
+    data = data.filter(DEMOGRAPHIC_AND_DRAW_COLUMNS)
     return data
 
 
@@ -435,19 +435,17 @@ def get_exposure_distribution_weights(
     valid_ages = utilities.get_exposure_and_restriction_ages(exposure, entity)
 
     data.drop("age_group_id", axis=1, inplace=True)
-    df = []
-    for age_id in valid_ages:
-        copied = data.copy()
-        copied["age_group_id"] = age_id
-        df.append(copied)
-    data = pd.concat(df)
-    data = utilities.normalize(data, fill_value=0, cols_to_fill=DISTRIBUTION_COLUMNS)
     if years != "all":
-        if years:
-            data = data.query(f"year_id=={years}")
+        year_id = years if years else utility_data.get_most_recent_year()
+        if "year_id" in data:
+            data = data[data.year_id == year_id]
         else:
-            most_recent_year = gbd.get_most_recent_year()
-            data = data.query(f"year_id=={most_recent_year}")
+            data["year_id"] = year_id
+
+    num_rows = len(data)
+    data = pd.concat([data] * len(valid_ages), ignore_index=True)
+    data["age_group_id"] = np.repeat(list(valid_ages), num_rows)
+    data = utilities.normalize(data, fill_value=0, cols_to_fill=DISTRIBUTION_COLUMNS)
     data = data.filter(DEMOGRAPHIC_COLUMNS + DISTRIBUTION_COLUMNS)
     data = utilities.wide_to_long(data, DISTRIBUTION_COLUMNS, var_name="parameter")
     return data
@@ -461,23 +459,28 @@ def filter_relative_risk_to_cause_restrictions(data: pd.DataFrame) -> pd.DataFra
     the relative_risk data"""
 
     age_bins = utility_data.get_age_bins()
-    ordered_age_ids = age_bins["age_group_id"].values
-    causes_map = {c.name: c for c in causes}
-    temp = []
-    affected_entities = set(data.affected_entity)
-    affected_measures = set(data.affected_measure)
-    for cause, measure in product(affected_entities, affected_measures):
-        df = data[(data.affected_entity == cause) & (data.affected_measure == measure)]
-        cause = causes_map[cause]
+    ordered_age_ids = list(age_bins["age_group_id"])
+    key_columns = ["affected_entity", "affected_measure"]
+    pairs = data[key_columns].drop_duplicates().dropna()
+    allowed = []
+    for cause_name, measure in pairs.itertuples(index=False):
+        cause = CAUSES_BY_NAME[cause_name]
         if measure == "cause_specific_mortality_rate":
             start, end = utilities.get_age_group_ids_by_restriction(cause, "yll")
         else:  # incidence_rate
             start, end = utilities.get_age_group_ids_by_restriction(cause, "yld")
-        start_index = list(ordered_age_ids).index(start)
-        end_index = list(ordered_age_ids).index(end)
-        allowed_ids = ordered_age_ids[start_index : (end_index + 1)]
-        temp.append(df[df.age_group_id.isin(allowed_ids)])
-    data = pd.concat(temp)
+        allowed_ids = utilities.get_restriction_age_ids(start, end, ordered_age_ids)
+        allowed.append(
+            pd.DataFrame(
+                {
+                    "affected_entity": cause_name,
+                    "affected_measure": measure,
+                    "age_group_id": allowed_ids,
+                }
+            )
+        )
+    allowed = pd.concat(allowed, ignore_index=True)
+    data = data.merge(allowed, on=key_columns + ["age_group_id"])
     return data
 
 
@@ -497,15 +500,16 @@ def get_relative_risk(
     # FIXME: we don't currently support yll-only causes so I'm dropping them because the data in some cases is
     #  very messed up, with mort = morb = 1 (e.g., aortic aneurysm in the RR data for high systolic bp) -
     #  2/8/19 K.W.
-    yll_only_causes = set([c.gbd_id for c in causes if c.restrictions.yll_only])
-    data = data[~data.cause_id.isin(yll_only_causes)]
+    data = data[~data.cause_id.isin(YLL_ONLY_CAUSE_IDS)]
 
     data = utilities.convert_affected_entity(data, "cause_id")
     morbidity = data.morbidity == 1
     mortality = data.mortality == 1
-    data.loc[morbidity & mortality, "affected_measure"] = "incidence_rate"
-    data.loc[morbidity & ~mortality, "affected_measure"] = "incidence_rate"
-    data.loc[~morbidity & mortality, "affected_measure"] = "cause_specific_mortality_rate"
+    data["affected_measure"] = np.where(
+        morbidity, "incidence_rate", "cause_specific_mortality_rate"
+    )
+    # Rows flagged for neither morbidity nor mortality affect no measure.
+    data = data[morbidity | mortality]
     data = filter_relative_risk_to_cause_restrictions(data)
     data = data.filter(
         DEMOGRAPHIC_COLUMNS
@@ -520,28 +524,19 @@ def get_relative_risk(
     if entity.distribution in ["dichotomous", "ordered_polytomous", "unordered_polytomous"]:
         tmrel_cat = utility_data.get_tmrel_category(entity)
         tmrel_mask = data.parameter == tmrel_cat
-        data.loc[tmrel_mask, DRAW_COLUMNS] = data.loc[tmrel_mask, DRAW_COLUMNS].mask(
-            np.isclose(data.loc[tmrel_mask, DRAW_COLUMNS], 1.0), 1.0
+        tmrel_draws = data.loc[tmrel_mask, DRAW_COLUMNS].to_numpy()
+        data.loc[tmrel_mask, DRAW_COLUMNS] = np.where(
+            np.isclose(tmrel_draws, 1.0), 1.0, tmrel_draws
         )
 
     return data
 
 
-def filter_by_relative_risk(df: pd.DataFrame, relative_risk: pd.DataFrame) -> pd.DataFrame:
-    c_id = df.cause_id.unique()[0]
-    rr = relative_risk[relative_risk.cause_id == c_id]
-    #  We presume all attributable mortality moves through incidence.
-    if set(rr.mortality) == {1} and set(rr.morbidity) == {1}:
-        df = df[df.measure_id == MEASURES["YLDs"]]
-    return df
-
-
 def get_population_attributable_fraction(
     entity: Union[RiskFactor, Etiology],
     location_id: List[int],
     years: Optional[Union[int, str, List[int]]] = None,
 ) -> pd.DataFrame:
-    causes_map = {c.gbd_id: c for c in causes}
     if entity.kind == "risk_factor":
         data = extract.extract_data(
             entity,
@@ -561,24 +556,29 @@ def get_population_attributable_fraction(
         # FIXME: we don't currently support yll-only causes so I'm dropping them because the data in some cases is
         #  very messed up, with mort = morb = 1 (e.g., aortic aneurysm in the RR data for high systolic bp) -
         #  2/8/19 K.W.
-        yll_only_causes = set([c.gbd_id for c in causes if c.restrictions.yll_only])
-        data = data[~data.cause_id.isin(yll_only_causes)]
-        relative_risk = relative_risk[~relative_risk.cause_id.isin(yll_only_causes)]
-
-        data = (
-            data.groupby("cause_id", as_index=False)
-            .apply(filter_by_relative_risk, relative_risk)
-            .reset_index(drop=True)
+        data = data[~data.cause_id.isin(YLL_ONLY_CAUSE_IDS)]
+        relative_risk = relative_risk[~relative_risk.cause_id.isin(YLL_ONLY_CAUSE_IDS)]
+
+        #  We presume all attributable mortality moves through incidence.
+        rr_flags_all_one = (
+            (relative_risk[["mortality", "morbidity"]] == 1)
+            .all(axis=1)
+            .groupby(relative_risk.cause_id)
+            .all()
         )
+        causes_with_yld_only_pafs = rr_flags_all_one.index[rr_flags_all_one]
+        data = data[
+            ~data.cause_id.isin(causes_with_yld_only_pafs)
+            | (data.measure_id == MEASURES["YLDs"])
+        ].reset_index(drop=True)
 
         temp = []
+        age_group_ids = utility_data.get_age_group_ids()
         # We filter paf age groups by cause level restrictions.
         for (c_id, measure), df in data.groupby(["cause_id", "measure_id"]):
-            cause = causes_map[c_id]
+            cause = CAUSES_BY_ID[c_id]
             measure = "yll" if measure == MEASURES["YLLs"] else "yld"
-            df = utilities.filter_data_by_restrictions(
-                df, cause, measure, utility_data.get_age_group_ids()
-            )
+            df = utilities.filter_data_by_restrictions(df, cause, measure, age_group_ids)
             temp.append(df)
         data = pd.concat(temp, ignore_index=True)
 
@@ -594,19 +594,18 @@ def get_population_attributable_fraction(
         data = utilities.filter_data_by_restrictions(
             data, cause, "inner", utility_data.get_age_group_ids()
         )
-        if np.any(data[DRAW_COLUMNS] < 0):
+        draws = data[DRAW_COLUMNS].to_numpy()
+        if (draws < 0).any():
             logger.warning(
                 f"{entity.name.capitalize()} has negative values for paf. These will be replaced with 0."
             )
-            other_cols = [c for c in data.columns if c not in DRAW_COLUMNS]
-            data.set_index(other_cols, inplace=True)
-            data = data.where(data[DRAW_COLUMNS] > 0, 0).reset_index()
+            data = data.copy()
+            data[DRAW_COLUMNS] = np.where(draws > 0, draws, 0)
 
     data = utilities.convert_affected_entity(data, "cause_id")
-    data.loc[
-        data["measure_id"] == MEASURES["YLLs"], "affected_measure"
-    ] = "excess_mortality_rate"
-    data.loc[data["measure_id"] == MEASURES["YLDs"], "affected_measure"] = "incidence_rate"
+    data["affected_measure"] = data["measure_id"].map(
+        {MEASURES["YLLs"]: "excess_mortality_rate", MEASURES["YLDs"]: "incidence_rate"}
+    )
     data = (
         data.groupby(["affected_entity", "affected_measure"])
         .apply(utilities.normalize, fill_value=0)
@@ -646,7 +645,7 @@ def get_estimate(
 def get_utilization_rate(entity: HealthcareEntity, location_id: List[int]) -> pd.DataFrame:
     data = extract.extract_data(entity, "utilization_rate", location_id)
     data = utilities.normalize(data, fill_value=0)
-    data = data.filter(DEMOGRAPHIC_COLUMNS + DRAW_COLUMNS)
+    data = data.filter(DEMOGRAPHIC_AND_DRAW_COLUMNS)
     return data
 
 
@@ -1,9 +1,12 @@
-from typing import List, Optional, Union
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple, Union
 
+import numpy as np
 import pandas as pd
 from gbd_mapping import Cause, Covariate, Etiology, ModelableEntity, RiskFactor, Sequela
 
 import vivarium_inputs.validation.raw as validation
+from vivarium_inputs import utility_data
 from vivarium_inputs.globals import (
     DRAW_COLUMNS,
     MEASURES,
@@ -105,11 +108,11 @@ def extract_data(
 
     # update year_id value for gbd calls
     if years == None:  # default to most recent year
-        year_id = gbd.get_most_recent_year()
+        year_id = utility_data.get_most_recent_year()
     elif years == "all":
         year_id = None
     else:
-        estimation_years = gbd.get_estimation_years()
+        estimation_years = utility_data.get_estimation_years()
         if years not in estimation_years:
             raise ValueError(f"years must be in {estimation_years}. You provided {years}.")
         year_id = years
@@ -143,7 +146,7 @@ def extract_data(
 
     # drop extra draw columns
     existing_draw_cols = [col for col in data if col.startswith("draw_")]
-    extra_draw_cols = [col for col in existing_draw_cols if col not in DRAW_COLUMNS]
+    extra_draw_cols = pd.Index(existing_draw_cols).difference(DRAW_COLUMNS)
     data = data.drop(columns=extra_draw_cols, errors="ignore")
 
     if validate:
@@ -213,29 +216,26 @@ def extract_remission_rate(
     return data
 
 
+@lru_cache(maxsize=None)
+def _load_disability_weights(kind: str) -> Tuple[pd.DataFrame, Dict[int, np.ndarray]]:
+    # The flat file read by gbd.get_auxiliary_data only has location_id 1
+    # because disability weights are the same for all locations.
+    disability_weights = gbd.get_auxiliary_data("disability_weight", kind, "all", [1])
+    return disability_weights, disability_weights.groupby("healthstate_id").indices
+
+
 def extract_disability_weight(
     entity: Sequela,
     location_id: List[int],
     year_id: Optional[Union[int, str, List[int]]] = None,
 ) -> pd.DataFrame:
-    disability_weights = gbd.get_auxiliary_data(
-        "disability_weight",
-        entity.kind,
-        "all",
-        location_id,
-    )
-    disability_data = disability_weights.loc[
-        disability_weights.healthstate_id == entity.healthstate.gbd_id, :
+    disability_weights, healthstate_rows = _load_disability_weights(entity.kind)
+    disability_data = disability_weights.iloc[
+        healthstate_rows.get(entity.healthstate.gbd_id, [])
     ]
     # Update location_id to match original location id
-    # Note: The flat file we read data from in gbd.get_auxiliary_data only has location_id 1
-    # because disability weights are the same for all locations
-    data = []
-    for loc_id in location_id:
-        loc_data = disability_data.copy()
-        loc_data["location_id"] = loc_id
-        data.append(loc_data)
-    data = pd.concat(data)
+    data = pd.concat([disability_data] * len(location_id))
+    data["location_id"] = np.repeat(location_id, len(disability_data))
     if year_id:  # if not pulling all years
         data["year_id"] = year_id
     return data
@@ -337,13 +337,14 @@ def extract_population_attributable_fraction(
     year_id: Optional[Union[int, str, List[int]]] = None,
 ) -> pd.DataFrame:
     data = gbd.get_paf(entity.gbd_id, location_id, year_id=year_id)
-    data = data[data.metric_id == METRICS["Percent"]]
-    data = data[data.measure_id.isin([MEASURES["YLDs"], MEASURES["YLLs"]])]
+    data = data[
+        (data.metric_id == METRICS["Percent"])
+        & data.measure_id.isin([MEASURES["YLDs"], MEASURES["YLLs"]])
+    ]
     data = filter_to_most_detailed_causes(data)
     # clip PAFs between 0 and 1 (data outside these bounds is expected from GBD)
     draw_cols = [col for col in data.columns if col.startswith("draw_")]
-    data.loc[:, draw_cols] = data[draw_cols].clip(lower=0)
-    data.loc[:, draw_cols] = data[draw_cols].clip(upper=1)
+    data.loc[:, draw_cols] = data[draw_cols].clip(lower=0, upper=1)
     return data
 
 
@@ -160,6 +160,9 @@ DRAW_COLUMNS = [f"draw_{i}" for i in range(NUM_DRAWS)]
 SEXES = {"Male": 1, "Female": 2, "Combined": 3}
 # Mapping of non-standard age group ids sometimes found in GBD data
 SPECIAL_AGES = {"all_ages": 22, "age_standardized": 27}
+# Mappings of GBD cause ids and cause names to gbd_mapping causes
+CAUSES_BY_ID = {c.gbd_id: c for c in causes}
+CAUSES_BY_NAME = {c.name: c for c in causes}
 
 # Cause-risk pair where risk may have a protective effect on a certain cause with negative paf
 PROTECTIVE_CAUSE_RISK_PAIRS = {
@@ -9,6 +9,7 @@ from gbd_mapping import Cause, RiskFactor, causes, risk_factors
 
 from vivarium_inputs import utility_data
 from vivarium_inputs.globals import (
+    CAUSES_BY_ID,
     DEMOGRAPHIC_COLUMNS,
     DRAW_COLUMNS,
     SEXES,
@@ -17,6 +18,8 @@ from vivarium_inputs.globals import (
 
 INDEX_COLUMNS = DEMOGRAPHIC_COLUMNS + ["affected_entity", "affected_measure", "parameter"]
 
+SEX_NAME_BY_ID = {SEXES[name]: name for name in ["Male", "Female"]}
+
 ##################################################
 # Functions to remove GBD conventions from data. #
 ##################################################
@@ -53,7 +56,7 @@ def scrub_sex(data):
     if "sex_id" in data.index.names:
         levels = list(
             data.index.levels[data.index.names.index("sex_id")].map(
-                lambda x: {1: "Male", 2: "Female"}.get(x, x)
+                lambda x: SEX_NAME_BY_ID.get(x, x)
             )
         )
         data.index = data.index.rename("sex", level="sex_id").set_levels(levels, level="sex")
@@ -64,10 +67,10 @@ def scrub_age(data):
     if "age_group_id" in data.index.names:
         age_bins = utility_data.get_age_bins().set_index("age_group_id")
         id_levels = data.index.levels[data.index.names.index("age_group_id")]
-        interval_levels = [
-            pd.Interval(age_bins.age_start[age_id], age_bins.age_end[age_id], closed="left")
-            for age_id in id_levels
-        ]
+        level_bins = age_bins.loc[id_levels]
+        interval_levels = pd.IntervalIndex.from_arrays(
+            level_bins.age_start, level_bins.age_end, closed="left"
+        )
         data.index = data.index.rename("age", level="age_group_id").set_levels(
             interval_levels, level="age"
         )
@@ -77,9 +80,9 @@ def scrub_age(data):
 def scrub_year(data):
     if "year_id" in data.index.names:
         id_levels = data.index.levels[data.index.names.index("year_id")]
-        interval_levels = [
-            pd.Interval(year_id, year_id + 1, closed="left") for year_id in id_levels
-        ]
+        interval_levels = pd.IntervalIndex.from_arrays(
+            id_levels, id_levels + 1, closed="left"
+        )
         data.index = data.index.rename("year", level="year_id").set_levels(
             interval_levels, level="year"
         )
@@ -87,24 +90,22 @@ def scrub_year(data):
 
 
 def scrub_affected_entity(data):
-    CAUSE_BY_ID = {c.gbd_id: c for c in causes}
-    # RISK_BY_ID = {r.gbd_id: r for r in risk_factors}
     if "cause_id" in data.columns:
-        data["affected_entity"] = data.cause_id.apply(
-            lambda cause_id: CAUSE_BY_ID[cause_id].name
-        )
+        # Indexing by each unique id keeps unknown cause ids a KeyError.
+        name_map = {c_id: CAUSES_BY_ID[c_id].name for c_id in data.cause_id.unique()}
+        data["affected_entity"] = data.cause_id.map(name_map)
         data.drop("cause_id", axis=1, inplace=True)
     return data
 
 
 def set_age_interval(data):
     if "age_start" in data.index.names:
-        bins = zip(
-            data.index.get_level_values("age_start"), data.index.get_level_values("age_end")
+        age = pd.IntervalIndex.from_arrays(
+            data.index.get_level_values("age_start"),
+            data.index.get_level_values("age_end"),
+            closed="left",
         )
-        data = data.assign(
-            age=[pd.Interval(x[0], x[1], closed="left") for x in bins]
-        ).set_index("age", append=True)
+        data = data.assign(age=age).set_index("age", append=True)
         data.index = data.index.droplevel("age_start").droplevel("age_end")
     return data
 
@@ -133,18 +134,19 @@ def normalize_sex(data: pd.DataFrame, fill_value, cols_to_fill) -> pd.DataFrame:
         data = data[data.sex_id.isin([SEXES["Male"], SEXES["Female"]])]
     elif sexes == {SEXES["Combined"]}:
         # Data is not sex specific, but does apply to both sexes, so copy.
-        fill_data = data.copy()
-        data.loc[:, "sex_id"] = SEXES["Male"]
-        fill_data.loc[:, "sex_id"] = SEXES["Female"]
-        data = pd.concat([data, fill_data], ignore_index=True)
+        num_rows = len(data)
+        data = pd.concat([data, data], ignore_index=True)
+        data["sex_id"] = np.repeat([SEXES["Male"], SEXES["Female"]], num_rows)
     elif len(sexes) == 1:
         # Data is sex specific, but only applies to one sex, so fill the other with default.
-        fill_data = data.copy()
-        missing_sex = (
-            {SEXES["Male"], SEXES["Female"]}.difference(set(data.sex_id.unique())).pop()
+        missing_sex = {SEXES["Male"], SEXES["Female"]}.difference(sexes).pop()
+        fill_data = pd.concat(
+            [
+                data.drop(columns=cols_to_fill, errors="ignore").assign(sex_id=missing_sex),
+                pd.DataFrame(fill_value, index=data.index, columns=cols_to_fill),
+            ],
+            axis=1,
         )
-        fill_data.loc[:, "sex_id"] = missing_sex
-        fill_data.loc[:, cols_to_fill] = fill_value
         data = pd.concat([data, fill_data], ignore_index=True)
     else:  # sexes == {SEXES['Male'], SEXES['Female']}
         pass
@@ -160,12 +162,9 @@ def normalize_year(data: pd.DataFrame) -> pd.DataFrame:
 
     if "year_id" not in data:
         # Data doesn't vary by year, so copy for each year.
-        df = []
-        for year in years["annual"]:
-            fill_data = data.copy()
-            fill_data["year_id"] = year
-            df.append(fill_data)
-        data = pd.concat(df, ignore_index=True)
+        num_rows = len(data)
+        data = pd.concat([data] * len(years["annual"]), ignore_index=True)
+        data["year_id"] = np.repeat(years["annual"], num_rows)
     elif set(data.year_id) == set(years["binned"]):
         data = interpolate_year(data)
     else:  # set(data.year_id.unique()) == years['annual']
@@ -196,12 +195,9 @@ def normalize_age(
         pass
     elif data_ages == {SPECIAL_AGES["all_ages"]}:
         # Data applies to all ages, so copy.
-        dfs = []
-        for age in gbd_ages:
-            missing = data.copy()
-            missing.loc[:, "age_group_id"] = age
-            dfs.append(missing)
-        data = pd.concat(dfs, ignore_index=True)
+        num_rows = len(data)
+        data = pd.concat([data] * len(gbd_ages), ignore_index=True)
+        data["age_group_id"] = np.repeat(list(gbd_ages), num_rows)
     elif data_ages < gbd_ages:
         # Data applies to subset, so fill other ages with fill value.
         key_columns = list(data.columns.difference(cols_to_fill))
@@ -265,7 +261,7 @@ def convert_affected_entity(data: pd.DataFrame, column: str) -> pd.DataFrame:
     ids = data[column].unique()
     data = data.rename(columns={column: "affected_entity"})
     if column == "cause_id":
-        name_map = {c.gbd_id: c.name for c in causes if c.gbd_id in ids}
+        name_map = {c_id: CAUSES_BY_ID[c_id].name for c_id in ids if c_id in CAUSES_BY_ID}
     else:  # column == 'rei_id'
         name_map = {r.gbd_id: r.name for r in risk_factors if r.gbd_id in ids}
     data["affected_entity"] = data["affected_entity"].map(name_map)
@@ -276,8 +272,8 @@ def compute_categorical_paf(
     rr_data: pd.DataFrame, e: pd.DataFrame, affected_entity: str
 ) -> pd.DataFrame:
     rr = rr_data[rr_data.affected_entity == affected_entity]
-    affected_measure = rr.affected_measure.unique()[0]
-    rr.drop(["affected_entity", "affected_measure"], axis=1, inplace=True)
+    affected_measure = rr.affected_measure.iat[0]
+    rr = rr.drop(columns=["affected_entity", "affected_measure"])
 
     key_cols = ["sex_id", "age_group_id", "year_id", "parameter", "draw"]
     e = e.set_index(key_cols).sort_index(level=key_cols)
@@ -285,7 +281,7 @@ def compute_categorical_paf(
 
     weighted_rr = e * rr
     groupby_cols = [c for c in key_cols if c != "parameter"]
-    mean_rr = weighted_rr.reset_index().groupby(groupby_cols)["value"].sum()
+    mean_rr = weighted_rr.groupby(level=groupby_cols)["value"].sum()
     paf = ((mean_rr - 1) / mean_rr).reset_index()
     paf = paf.replace(-np.inf, 0)  # Rows with zero exposure.
 
@@ -362,11 +358,9 @@ def filter_data_by_restrictions(
     else:  # not male only and not female only
         sexes = [SEXES["Male"], SEXES["Female"], SEXES["Combined"]]
 
-    data = data[data.sex_id.isin(sexes)]
-
     start, end = get_age_group_ids_by_restriction(entity, which_age)
     ages = get_restriction_age_ids(start, end, age_group_ids)
-    data = data[data.age_group_id.isin(ages)]
+    data = data[data.sex_id.isin(sexes) & data.age_group_id.isin(ages)]
     return data
 
 
@@ -484,20 +478,17 @@ def get_exposure_and_restriction_ages(exposure: pd.DataFrame, entity: RiskFactor
 
 def split_interval(data, interval_column, split_column_prefix):
     if isinstance(data, pd.DataFrame) and interval_column in data.index.names:
-        data[f"{split_column_prefix}_end"] = [
-            x.right for x in data.index.get_level_values(interval_column)
-        ]
+        intervals = pd.IntervalIndex(data.index.get_level_values(interval_column))
+        data[f"{split_column_prefix}_end"] = intervals.right
         if not isinstance(data.index, pd.MultiIndex):
-            data[f"{split_column_prefix}_start"] = [
-                x.left for x in data.index.get_level_values(interval_column)
-            ]
+            data[f"{split_column_prefix}_start"] = intervals.left
             data = data.set_index(
                 [f"{split_column_prefix}_start", f"{split_column_prefix}_end"]
             )
         else:
-            interval_starts = [
-                x.left for x in data.index.levels[data.index.names.index(interval_column)]
-            ]
+            interval_starts = pd.IntervalIndex(
+                data.index.levels[data.index.names.index(interval_column)]
+            ).left
             data.index = data.index.rename(
                 f"{split_column_prefix}_start", level=interval_column
             ).set_levels(interval_starts, level=f"{split_column_prefix}_start")
@@ -519,13 +510,11 @@ def process_kidney_dysfunction_exposure(
     data["measure_id"] = 5
     # recalculate cat5
     draw_cols = [col for col in data.columns if col.startswith("draw_")]
-    groupby_cols = [
-        col
-        for col in data.columns
-        if col not in draw_cols + ["parameter", "modelable_entity_id"]
-    ]
+    groupby_cols = data.columns.difference(
+        draw_cols + ["parameter", "modelable_entity_id"], sort=False
+    ).tolist()
     # calculate residual values with 1-(sum of other categories)
-    cat5_data = 1 - data.groupby(groupby_cols).sum()
+    cat5_data = 1 - data.groupby(groupby_cols)[draw_cols].sum()
     cat5_data = cat5_data.reset_index()
     cat5_data["parameter"] = "cat5"
     cat5_data["modelable_entity_id"] = np.nan
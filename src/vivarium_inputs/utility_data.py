@@ -1,16 +1,46 @@
+from functools import lru_cache
 from typing import Dict, List, Optional, Union
 
 import pandas as pd
 from gbd_mapping import RiskFactor
 
-from vivarium_inputs.globals import NON_MAX_TMREL, NUM_DRAWS, SEXES, gbd
+from vivarium_inputs.globals import DRAW_COLUMNS, NON_MAX_TMREL, SEXES, gbd
+
+
+@lru_cache(maxsize=None)
+def _load_estimation_years() -> pd.Series:
+    return gbd.get_estimation_years()
+
+
+@lru_cache(maxsize=None)
+def _load_most_recent_year() -> int:
+    return gbd.get_most_recent_year()
+
+
+@lru_cache(maxsize=None)
+def _load_age_group_ids() -> List[int]:
+    return gbd.get_age_group_id()
+
+
+@lru_cache(maxsize=None)
+def _load_age_bins() -> pd.DataFrame:
+    return gbd.get_age_bins()
+
+
+@lru_cache(maxsize=None)
+def _load_location_ids() -> pd.DataFrame:
+    return gbd.get_location_ids()
 
 
 def get_estimation_years(*_, **__) -> pd.Series:
-    data = gbd.get_estimation_years()
+    data = _load_estimation_years().copy()
     return data
 
 
+def get_most_recent_year(*_, **__) -> int:
+    return _load_most_recent_year()
+
+
 def get_year_block(*_, **__) -> pd.DataFrame:
     estimation_years = get_estimation_years()
     year_block = pd.DataFrame(
@@ -21,28 +51,36 @@ def get_year_block(*_, **__) -> pd.DataFrame:
 
 
 def get_age_group_ids(*_, **__) -> List[int]:
-    data = gbd.get_age_group_id()
+    data = _load_age_group_ids().copy()
     return data
 
 
 def get_age_bins(*_, **__) -> pd.DataFrame:
-    age_bins = gbd.get_age_bins()[
+    age_bins = _load_age_bins()[
         ["age_group_id", "age_group_name", "age_group_years_start", "age_group_years_end"]
     ].rename(columns={"age_group_years_start": "age_start", "age_group_years_end": "age_end"})
     age_bins = age_bins.sort_values("age_start").reset_index(drop=True)
     return age_bins
 
 
+@lru_cache(maxsize=None)
+def _get_location_name_to_id() -> Dict[str, int]:
+    locations = _load_location_ids()
+    return dict(zip(locations.location_name, locations.location_id))
+
+
+@lru_cache(maxsize=None)
+def _get_location_id_to_name() -> Dict[int, str]:
+    locations = _load_location_ids()
+    return dict(zip(locations.location_id, locations.location_name))
+
+
 def get_location_id(location_name: str) -> int:
-    return {r.location_name: r.location_id for _, r in gbd.get_location_ids().iterrows()}[
-        location_name
-    ]
+    return _get_location_name_to_id()[location_name]
 
 
 def get_location_name(location_id: int) -> str:
-    return {
-        row.location_id: row.location_name for _, row in gbd.get_location_ids().iterrows()
-    }[location_id]
+    return _get_location_id_to_name()[location_id]
 
 
 def get_location_id_parents(location_id: Union[int, List[int]]) -> Dict[int, List]:
@@ -74,7 +112,7 @@ def get_demographic_dimensions(
     else:
         if years and years not in estimation_years:
             raise ValueError(f"years must be in {estimation_years}. You provided {years}.")
-        years = [years] if years else [gbd.get_most_recent_year()]
+        years = [years] if years else [get_most_recent_year()]
     sexes = [SEXES["Male"], SEXES["Female"]]
     location = [location_id] if isinstance(location_id, int) else location_id
     values = [location, sexes, ages, years]
@@ -82,8 +120,8 @@ def get_demographic_dimensions(
 
     data = pd.MultiIndex.from_product(values, names=names).to_frame(index=False)
     if draws:
-        for i in range(NUM_DRAWS):
-            data[f"draw_{i}"] = value
+        draw_data = pd.DataFrame(value, index=data.index, columns=DRAW_COLUMNS)
+        data = pd.concat([data, draw_data], axis=1)
     return data
 
 
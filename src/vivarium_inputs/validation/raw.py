@@ -1,5 +1,6 @@
 import operator
-from typing import List, Set, Tuple, Union
+from functools import lru_cache
+from typing import Dict, List, Set, Tuple, Union
 
 import numpy as np
 import pandas as pd
@@ -16,13 +17,13 @@ from loguru import logger
 
 from vivarium_inputs import utility_data
 from vivarium_inputs.globals import (
+    CAUSES_BY_ID,
     DEMOGRAPHIC_COLUMNS,
     DRAW_COLUMNS,
     EXCLUDE_ABNORMAL_DATA,
     MEASURES,
     METRICS,
     PAF_OUTSIDE_AGE_RESTRICTIONS,
-    PROBLEMATIC_RISKS,
     PROTECTIVE_CAUSE_RISK_PAIRS,
     RISKS_WITH_NEGATIVE_PAF,
     SEXES,
@@ -31,7 +32,6 @@ from vivarium_inputs.globals import (
     DataDoesNotExistError,
     InvalidQueryError,
     Population,
-    gbd,
 )
 from vivarium_inputs.mapping_extension import (
     AlternativeRiskFactor,
@@ -1021,10 +1021,10 @@ def validate_relative_risk(
     check_years(data, context, "binned")
     check_location(data, context)
 
-    for c_id in data.cause_id.unique():
-        cause = [c for c in causes if c.gbd_id == c_id][0]
+    for c_id, cause_data in data.groupby("cause_id"):
+        cause = CAUSES_BY_ID[c_id]
         check_mort_morb_flags(
-            data[data.cause_id == c_id],
+            cause_data,
             cause.restrictions.yld_only,
             cause.restrictions.yll_only,
         )
@@ -1044,7 +1044,7 @@ def validate_relative_risk(
         #  age-specific-causes even if risk-exposure may exist for the other age_group_ids. Instead we check age
         #  restrictions with affected causes.
         for (c_id, morb, mort, _), g in grouped:
-            cause = [c for c in causes if c.gbd_id == c_id][0]
+            cause = CAUSES_BY_ID[c_id]
             if morb == 1:
                 start, end = (
                     cause.restrictions.yld_age_group_id_start,
@@ -1162,9 +1162,10 @@ def validate_population_attributable_fraction(
     risk_female_expected = not restrictions.male_only
 
     grouped = data.groupby(["cause_id", "measure_id"])
+    non_trivial_age_groups = _get_non_trivial_age_groups(context, entity)
 
     for (c_id, _), g in grouped:
-        cause = [c for c in causes if c.gbd_id == c_id][0]
+        cause = CAUSES_BY_ID[c_id]
         cause_male_expected = risk_male_expected and not cause.restrictions.female_only
         cause_female_expected = risk_female_expected and not cause.restrictions.male_only
 
@@ -1173,7 +1174,7 @@ def validate_population_attributable_fraction(
         #  check only if there is a sex restriction (male only or female only).
         if not cause_male_expected or not cause_female_expected:
             check_sex_restrictions(g, context, cause_male_expected, cause_female_expected)
-        check_paf_rr_exposure_age_groups(g, context, entity)
+        check_paf_rr_exposure_age_groups(g, context, entity, non_trivial_age_groups)
 
     protective_causes = (
         PROTECTIVE_CAUSE_RISK_PAIRS[entity.name]
@@ -1343,9 +1344,10 @@ def validate_estimate(
     check_years(data, context, "annual")
     check_location(data, context)
 
+    data_age_ids = set(data.age_group_id)
     if entity.by_age:
         check_age_group_ids(data, context, None, None)
-        if not set(data.age_group_id).intersection(set(context["age_group_ids"])):
+        if not data_age_ids.intersection(context["age_group_ids"]):
             # if we have any of the expected gbd age group ids, restriction is not violated
             raise DataAbnormalError(
                 "Data is supposed to be age-separated, but does not contain any GBD age group ids."
@@ -1353,10 +1355,7 @@ def validate_estimate(
 
     # if we have any age group ids besides all ages and age standardized, restriction is violated
     if not entity.by_age and bool(
-        (
-            set(data.age_group_id)
-            - {SPECIAL_AGES["all_ages"], SPECIAL_AGES["age_standardized"]}
-        )
+        data_age_ids - {SPECIAL_AGES["all_ages"], SPECIAL_AGES["age_standardized"]}
     ):
         raise DataAbnormalError(
             "Data is not supposed to be separated by ages, but contains age groups "
@@ -1364,11 +1363,12 @@ def validate_estimate(
         )
 
     sexes = context["sexes"]
-    if entity.by_sex and not {sexes["Male"], sexes["Female"]}.issubset(set(data.sex_id)):
+    data_sex_ids = set(data.sex_id)
+    if entity.by_sex and not {sexes["Male"], sexes["Female"]}.issubset(data_sex_ids):
         raise DataAbnormalError(
             "Data is supposed to be by sex, but does not contain both male and female data."
         )
-    elif not entity.by_sex and set(data.sex_id) != {sexes["Combined"]}:
+    elif not entity.by_sex and data_sex_ids != {sexes["Combined"]}:
         raise DataAbnormalError(
             "Data is not supposed to be separated by sex, but contains sex ids beyond that "
             "for combined male and female data."
@@ -1726,26 +1726,77 @@ def check_cause_yll_yld_only_restrictions(
         found for yll only cause.
 
     """
+    yll_cause_ids = set(data.loc[data.measure_id == MEASURES["YLLs"], "cause_id"])
+    yld_cause_ids = set(data.loc[data.measure_id == MEASURES["YLDs"], "cause_id"])
     for c_id in set(data.cause_id):
-        cause = [c for c in causes if c.gbd_id == c_id][0]
-        if cause.restrictions.yld_only and np.any(
-            data[(data.cause_id == c_id) & (data.measure_id == MEASURES["YLLs"])]
-        ):
+        cause = CAUSES_BY_ID[c_id]
+        if cause.restrictions.yld_only and c_id in yll_cause_ids:
             raise DataAbnormalError(
                 f"Paf data for {entity.kind} {entity.name} affecting {cause.name} contains yll "
                 f"values despite the affected entity being restricted to yld only."
             )
-        if cause.restrictions.yll_only and np.any(
-            data[(data.cause_id == c_id) & (data.measure_id == MEASURES["YLDs"])]
-        ):
+        if cause.restrictions.yll_only and c_id in yld_cause_ids:
             raise DataAbnormalError(
                 f"Paf data for {entity.kind} {entity.name} affecting {cause.name} contains yld "
                 f"values despite the affected entity being restricted to yll only."
             )
 
 
+def _get_non_trivial_age_groups(
+    context: RawValidationContext, entity: RiskFactor
+) -> Union[Set, None]:
+    """Find the age groups with non-trivial risk for `entity`. These do not
+    depend on cause or measure, so they are computed once per validation.
+
+    Parameters
+    ----------
+    context
+        Wrapper for additional data used in the validation process.
+    entity
+        RiskFactor to which the data pertain.
+
+    Returns
+    -------
+    For continuous risk factors, the set of age group ids where exposure is
+    beyond the tmrel, or None if relative risk should not be filtered by
+    exposure. For categorical risk factors, the set of age group ids that
+    have non-trivial relative risk.
+
+    """
+    if entity.distribution in ["ensemble", "lognormal", "normal"]:
+        if entity.tmred.distribution == "draws":
+            ## TODO: [MIC-5049] handle iron deficiency TMREL in VPH
+            return None
+
+        exposure = context["exposure"]
+        tmrel = (entity.tmred.max + entity.tmred.min) / 2
+
+        #  Non-trivial rr for continuous risk factors is where exposure is bigger(smaller) than tmrel.
+        e_othercols = exposure.columns.difference(DRAW_COLUMNS, sort=False).tolist()
+        df = exposure.set_index(e_othercols)
+        op = operator.lt if entity.tmred.inverted else operator.gt
+        beyond_tmrel = op(df, tmrel).any(axis=1)
+        age_groups = set(df.index.get_level_values("age_group_id")[beyond_tmrel.to_numpy()])
+
+    else:  # categorical distribution
+        #  Non-trivial rr for categorical risk factors is where relative risk is not equal to 1.
+        #  Since non-trivial rr is determined by rr itself and rr age_group_id set is guaranteed to be
+        #  a subset of exposure age_group_id set, we do not check exposure here.
+        rr = context["relative_risk"]
+        rr_othercols = rr.columns.difference(DRAW_COLUMNS, sort=False).tolist()
+        df = rr.set_index(rr_othercols)
+        non_trivial = (df != 1).any(axis=1)
+        age_groups = set(df.index.get_level_values("age_group_id")[non_trivial.to_numpy()])
+
+    return age_groups
+
+
 def _get_valid_rr_and_age_groups(
-    context: RawValidationContext, entity: RiskFactor, cause: Cause, measure_id: int
+    context: RawValidationContext,
+    entity: RiskFactor,
+    cause: Cause,
+    measure_id: int,
+    non_trivial_age_groups: Union[Set, None],
 ) -> Tuple[Set, pd.DataFrame]:
     """According to the distribution type of RiskFactor, it finds the non-
     trivial relative risk and returns its age groups ids and relative risk
@@ -1761,6 +1812,9 @@ def _get_valid_rr_and_age_groups(
         Cause of which the restrictions to be used.
     measure_id
         Measure_id to be used to filter relative risk.
+    non_trivial_age_groups
+        Age group ids with non-trivial risk for `entity`, as returned by
+        `_get_non_trivial_age_groups`.
     Returns
     -------
     rr_age_groups is set of age group ids that have non trivial relative risk.
@@ -1768,45 +1822,27 @@ def _get_valid_rr_and_age_groups(
 
     """
     rr = context["relative_risk"]
-    exposure = context["exposure"]
-    rr_measures = {
-        "YLLs": (rr.morbidity == 0) & (rr.mortality == 1),
-        "YLDs": (rr.morbidity == 1),
-    }
-
-    measure = "YLLs" if measure_id == MEASURES["YLLs"] else "YLDs"
-    valid_rr = rr[(rr.cause_id == cause.gbd_id) & rr_measures[measure]]
+    if measure_id == MEASURES["YLLs"]:
+        measure_mask = (rr.morbidity == 0) & (rr.mortality == 1)
+    else:
+        measure_mask = rr.morbidity == 1
+    valid_rr = rr[(rr.cause_id == cause.gbd_id) & measure_mask]
 
     if entity.distribution in ["ensemble", "lognormal", "normal"]:
-        if entity.tmred.distribution == "draws":
-            ## TODO: [MIC-5049] handle iron deficiency TMREL in VPH
-            pass
-        else:
-            tmrel = (entity.tmred.max + entity.tmred.min) / 2
-
-            #  Non-trivial rr for continuous risk factors is where exposure is bigger(smaller) than tmrel.
-            e_othercols = [c for c in exposure.columns if c not in DRAW_COLUMNS]
-            df = exposure.set_index(e_othercols)
-            op = operator.lt if entity.tmred.inverted else operator.gt
-            exposed_age_groups = set(df[op(df, tmrel)].reset_index().age_group_id)
-
-            valid_rr = valid_rr[valid_rr.age_group_id.isin(exposed_age_groups)]
-
+        if non_trivial_age_groups is not None:
+            valid_rr = valid_rr[valid_rr.age_group_id.isin(non_trivial_age_groups)]
         rr_age_groups = set(valid_rr.age_group_id)
-
     else:  # categorical distribution
-        #  Non-trivial rr for categorical risk factors is where relative risk is not equal to 1.
-        #  Since non-trivial rr is determined by rr itself and rr age_group_id set is guaranteed to be
-        #  a subset of exposure age_group_id set, we do not check exposure here.
-        rr_othercols = [c for c in rr.columns if c not in DRAW_COLUMNS]
-        df = rr.set_index(rr_othercols)
-        rr_age_groups = set(df[df != 1].reset_index().age_group_id)
+        rr_age_groups = non_trivial_age_groups
 
     return rr_age_groups, valid_rr
 
 
 def check_paf_rr_exposure_age_groups(
-    paf: pd.DataFrame, context: RawValidationContext, entity: RiskFactor
+    paf: pd.DataFrame,
+    context: RawValidationContext,
+    entity: RiskFactor,
+    non_trivial_age_groups: Union[Set, None],
 ) -> None:
     """Check whether population attributable fraction data have consistent
     age group ids to the exposure, relative risk and cause restrictions.
@@ -1829,6 +1865,9 @@ def check_paf_rr_exposure_age_groups(
         Wrapper for additional data used in the validation process.
     entity
         RiskFactor for which to check age groups.
+    non_trivial_age_groups
+        Age group ids with non-trivial risk for `entity`, as returned by
+        `_get_non_trivial_age_groups`.
     Raises
     -------
     DataAbnormalError
@@ -1837,9 +1876,9 @@ def check_paf_rr_exposure_age_groups(
     """
     age_group_ids = context["age_group_ids"]
 
-    cause_id = paf.cause_id.unique()[0]
-    measure_id = paf.measure_id.unique()[0]
-    cause = [c for c in causes if c.gbd_id == cause_id][0]
+    cause_id = paf.cause_id.iat[0]
+    measure_id = paf.measure_id.iat[0]
+    cause = CAUSES_BY_ID[cause_id]
 
     age_restrictions = {
         MEASURES["YLLs"]: (
@@ -1852,7 +1891,9 @@ def check_paf_rr_exposure_age_groups(
         ),
     }
 
-    rr_age_groups, valid_rr = _get_valid_rr_and_age_groups(context, entity, cause, measure_id)
+    rr_age_groups, valid_rr = _get_valid_rr_and_age_groups(
+        context, entity, cause, measure_id, non_trivial_age_groups
+    )
 
     # It means we have YLL Paf but mortality = morbidity = 1 and we do not support this case.
     if measure_id == MEASURES["YLLs"] and valid_rr.empty:
@@ -1965,11 +2006,11 @@ def check_location(data: pd.DataFrame, context: RawValidationContext) -> None:
     """
 
     data_location_ids = data["location_id"].unique()
-    parent_locations = [
-        loc for value in context["parent_locations"].values() for loc in value
-    ]
+    valid_location_ids = set(context["location_id"]).union(
+        *context["parent_locations"].values()
+    )
     for location_id in data_location_ids:
-        if location_id not in context["location_id"] + parent_locations:
+        if location_id not in valid_location_ids:
             raise DataAbnormalError(
                 f"Data pulled for '{data_location_ids}' actually has location "
                 f"id {location_id}, which is not in its hierarchy."
@@ -1996,13 +2037,14 @@ def check_columns(expected_cols: List, existing_cols: List) -> None:
     - If `existing_colums` contains column names not found in `expected_columns`
 
     """
-    if set(existing_cols) < set(expected_cols):
+    existing_cols, expected_cols = set(existing_cols), set(expected_cols)
+    if existing_cols < expected_cols:
         raise DataAbnormalError(
-            f"Data is missing columns: {set(expected_cols).difference(set(existing_cols))}."
+            f"Data is missing columns: {expected_cols.difference(existing_cols)}."
         )
-    elif set(existing_cols) > set(expected_cols):
+    elif existing_cols > expected_cols:
         logger.warning(
-            f"Data returned extra columns: {set(existing_cols).difference(set(expected_cols))}."
+            f"Data returned extra columns: {existing_cols.difference(expected_cols)}."
         )
 
 
@@ -2041,12 +2083,13 @@ def check_data_exist(
         zeros_missing is True.
 
     """
-    if (
-        data.empty
-        or np.any(pd.isnull(data[value_columns]))
-        or (zeros_missing and np.all(data[value_columns] == 0))
-        or np.any(np.isinf(data[value_columns]))
-    ):
+    if data.empty:
+        missing = True
+    else:
+        values = data[value_columns].to_numpy(dtype=float)
+        missing = not np.isfinite(values).all() or (zeros_missing and not values.any())
+
+    if missing:
         if error:
             raise DataDoesNotExistError(
                 f'Data contains no non-missing{", non-zero" if zeros_missing else ""} values.'
@@ -2055,12 +2098,17 @@ def check_data_exist(
     return True
 
 
+@lru_cache(maxsize=None)
+def _get_age_start_by_id() -> Dict[int, float]:
+    age_bins = utility_data.get_age_bins()
+    return dict(zip(age_bins.age_group_id, age_bins.age_start))
+
+
 def _check_continuity(data_ages: set, all_ages: set) -> None:
     """Make sure data_ages is contiguous block in all_ages."""
     data_ages = list(data_ages)
     all_ages = list(all_ages)
-    age_bins = utility_data.get_age_bins()
-    id_to_age_map = dict(zip(age_bins.age_group_id, age_bins.age_start))
+    id_to_age_map = _get_age_start_by_id()
     all_ages.sort(key=lambda id: id_to_age_map[id])
     data_ages.sort(key=lambda id: id_to_age_map[id])
     if (
@@ -2226,8 +2274,9 @@ def check_age_restrictions(
     )
 
     # age groups we expected in data but that are not
-    missing_age_groups = set(expected_gbd_age_ids).difference(set(data.age_group_id))
-    extra_age_groups = set(data.age_group_id).difference(set(expected_gbd_age_ids))
+    data_age_groups = set(data.age_group_id)
+    missing_age_groups = set(expected_gbd_age_ids).difference(data_age_groups)
+    extra_age_groups = data_age_groups.difference(expected_gbd_age_ids)
 
     if missing_age_groups:
         message = (
@@ -2294,6 +2343,7 @@ def check_sex_restrictions(
     """
     sexes = context["sexes"]
     female, male, combined = sexes["Female"], sexes["Male"], sexes["Combined"]
+    data_sex_ids = set(data.sex_id)
 
     if male_only:
         if not check_data_exist(
@@ -2306,7 +2356,7 @@ def check_sex_restrictions(
                 "Data is restricted to male only, but is missing data values for males."
             )
 
-        if set(data.sex_id) != {male} and check_data_exist(
+        if data_sex_ids != {male} and check_data_exist(
             data[data.sex_id != male],
             zeros_missing=True,
             value_columns=value_columns,
@@ -2327,7 +2377,7 @@ def check_sex_restrictions(
                 "Data is restricted to female only, but is missing data values for females."
             )
 
-        if set(data.sex_id) != {female} and check_data_exist(
+        if data_sex_ids != {female} and check_data_exist(
             data[data.sex_id != female],
             zeros_missing=True,
             value_columns=value_columns,
@@ -2339,7 +2389,7 @@ def check_sex_restrictions(
             )
 
     if not male_only and not female_only:
-        if {male, female}.issubset(set(data.sex_id)):
+        if {male, female}.issubset(data_sex_ids):
             if not check_data_exist(
                 data[data.sex_id == male],
                 zeros_missing=True,
@@ -2392,9 +2442,10 @@ def check_measure_id(
         or a non-permissible measure id.
 
     """
-    if single_only and len(set(data.measure_id)) > 1:
-        raise DataAbnormalError(f"Data has multiple measure ids: {set(data.measure_id)}.")
-    if not set(data.measure_id).issubset(set([MEASURES[m] for m in allowable_measures])):
+    data_measure_ids = set(data.measure_id)
+    if single_only and len(data_measure_ids) > 1:
+        raise DataAbnormalError(f"Data has multiple measure ids: {data_measure_ids}.")
+    if not data_measure_ids.issubset({MEASURES[m] for m in allowable_measures}):
         raise DataAbnormalError(
             f"Data includes a measure id not in the expected measure ids for this measure."
         )
@@ -15,12 +15,12 @@ from gbd_mapping import (
 from vivarium_inputs import utilities, utility_data
 from vivarium_inputs.globals import (
     BOUNDARY_SPECIAL_CASES,
+    CAUSES_BY_NAME,
     DRAW_COLUMNS,
     PROTECTIVE_CAUSE_RISK_PAIRS,
     RISKS_WITH_NEGATIVE_PAF,
     DataTransformationError,
     Population,
-    gbd,
 )
 from vivarium_inputs.mapping_extension import (
     AlternativeRiskFactor,
@@ -163,7 +163,7 @@ def validate_for_simulation(
                 {"year_start": years, "year_end": years + 1}, index=[0]
             )
         else:
-            most_recent_year = gbd.get_most_recent_year()
+            most_recent_year = utility_data.get_most_recent_year()
             context_args["years"] = pd.DataFrame(
                 {"year_start": most_recent_year, "year_end": most_recent_year + 1}, index=[0]
             )
@@ -562,20 +562,21 @@ def validate_excess_mortality_rate(
         error=DataTransformationError,
     )
 
-    for location in context["location"]:
-        if entity.name in BOUNDARY_SPECIAL_CASES["excess_mortality_rate"].get(location, {}):
-            max_val = BOUNDARY_SPECIAL_CASES["excess_mortality_rate"][context["location"]][
-                entity.name
-            ]
-        else:
-            max_val = VALID_EXCESS_MORT_RANGE[1]
-        check_value_columns_boundary(
-            data,
-            boundary_value=max_val,
-            boundary_type="upper",
-            value_columns=DRAW_COLUMNS,
-            error=DataTransformationError,
-        )
+    special_cases = BOUNDARY_SPECIAL_CASES["excess_mortality_rate"]
+    location_max_values = {
+        location: special_cases.get(location, {}).get(entity.name, VALID_EXCESS_MORT_RANGE[1])
+        for location in context["location"]
+    }
+    max_val = pd.Series(
+        data.index.get_level_values("location").map(location_max_values), index=data.index
+    )
+    check_value_columns_boundary(
+        data,
+        boundary_value=max_val,
+        boundary_type="upper",
+        value_columns=DRAW_COLUMNS,
+        error=DataTransformationError,
+    )
 
     check_age_restrictions(data, entity, rest_type="yll", fill_value=0.0, context=context)
     check_sex_restrictions(
@@ -803,7 +804,7 @@ def validate_exposure_distribution_weights(
 
     non_weight_columns = SCRUBBED_DEMOGRAPHIC_COLUMNS
     weights_sum = data.groupby(non_weight_columns)["value"].sum()
-    if not weights_sum.apply(lambda s: np.isclose(s, 1.0) or np.isclose(s, 0.0)).all():
+    if not (np.isclose(weights_sum, 1.0) | np.isclose(weights_sum, 0.0)).all():
         raise DataTransformationError(
             "Exposure weights do not sum to one across demographics."
         )
@@ -1015,7 +1016,7 @@ def validate_population_attributable_fraction(
         )
 
     for (c_name, measure), g in risk_relationship:
-        cause = [c for c in causes if c.name == c_name][0]
+        cause = CAUSES_BY_NAME[c_name]
         if measure == "incidence_rate":
             check_age_restrictions(g, cause, rest_type="yld", fill_value=0.0, context=context)
         else:  # excess mortality
@@ -1072,8 +1073,7 @@ def validate_estimate(
     validate_year_column(data, context)
     validate_value_column(data)
 
-    cols = list(set(expected_index_names).difference({"parameter", "value"}))
-    data.groupby(cols).apply(check_covariate_values)
+    check_covariate_values(data)
 
 
 def validate_cost(
@@ -1501,13 +1501,13 @@ def validate_age_column(data: pd.DataFrame, context: SimulationValidationContext
         age bins supplied in `context`.
 
     """
-    expected_ages = [
-        pd.Interval(row.age_start, row.age_end, closed="left")
-        for _, row in context["age_bins"].iterrows()
-    ]
+    age_bins = context["age_bins"]
+    expected_ages = pd.IntervalIndex.from_arrays(
+        age_bins.age_start, age_bins.age_end, closed="left"
+    )
     data_ages = data.index.levels[data.index.names.index("age")]
 
-    if not sorted(data_ages) == sorted(expected_ages):
+    if set(data_ages) != set(expected_ages):
         raise DataTransformationError(
             "Age_start and age_end must contain all gbd age groups."
         )
@@ -1530,13 +1530,13 @@ def validate_year_column(data: pd.DataFrame, context: SimulationValidationContex
         supplied in `context`.
 
     """
-    expected_years = [
-        pd.Interval(row.year_start, row.year_end, closed="left")
-        for _, row in context["years"].iterrows()
-    ]
+    years = context["years"]
+    expected_years = pd.IntervalIndex.from_arrays(
+        years.year_start, years.year_end, closed="left"
+    )
     data_years = data.index.levels[data.index.names.index("year")]
 
-    if not sorted(data_years) == sorted(expected_years):
+    if set(data_years) != set(expected_years):
         formatted_expected_years = [interval.left for interval in sorted(expected_years)]
         formatted_data_years = [interval.left for interval in sorted(data_years)]
         raise DataTransformationError(
@@ -1562,9 +1562,10 @@ def validate_value_column(data: pd.DataFrame) -> None:
 
     """
 
-    if np.any(np.isnan(data.values)):
-        raise DataTransformationError("Value data found to contain NaN.")
-    if np.any(np.isinf(data.values)):
+    values = data.to_numpy()
+    if not np.isfinite(values).all():
+        if np.isnan(values).any():
+            raise DataTransformationError("Value data found to contain NaN.")
         raise DataTransformationError("Value data found to contain infinity.")
 
 
@@ -1610,10 +1611,9 @@ def check_age_restrictions(
     in_range_ages = age_bins.loc[
         (age_bins.age_start >= age_range_start) & (age_bins.age_start <= age_range_end)
     ]
-    in_range_age_intervals = [
-        pd.Interval(row.age_start, row.age_end, closed="left")
-        for _, row in in_range_ages.iterrows()
-    ]
+    in_range_age_intervals = pd.IntervalIndex.from_arrays(
+        in_range_ages.age_start, in_range_ages.age_end, closed="left"
+    )
     outside = data.loc[~data.index.isin(in_range_age_intervals, "age")]
 
     if (
@@ -1747,22 +1747,25 @@ def check_covariate_values(data: pd.DataFrame) -> None:
     Parameters
     ----------
     data
-        Simulation-prepped covariate estimate data for a single demographic
-        group.
+        Simulation-prepped covariate estimate data.
 
     Raises
     ------
     DataTransformationError
-        If lower, mean, and upper values are not all 0 and it is not the case
-         that lower < mean < upper.
+        If for any demographic group lower, mean, and upper values are not
+        all 0 and it is not the case that lower < mean < upper.
     """
-    lower = data.xs("lower_value", level="parameter").value.values
-    mean = data.xs("mean_value", level="parameter").value.values
-    upper = data.xs("upper_value", level="parameter").value.values
+    # One row per demographic group, one column per parameter.
+    values = data["value"].unstack("parameter")
+    lower = values["lower_value"]
+    mean = values["mean_value"]
+    upper = values["upper_value"]
 
     # allow the case where lower = mean = upper = 0 b/c of things like age
     # specific fertility rate where all estimates are 0 for young age groups
-    if np.all(data.value != 0) and not np.all(lower <= mean <= upper):
+    non_zero = (values != 0).all(axis=1)
+    ordered = (lower <= mean) & (mean <= upper)
+    if (non_zero & ~ordered).any():
         raise DataTransformationError(
             "Covariate data contains demographic groups for which the "
             "estimates for lower, mean, and upper values are not all 0 "
@@ -40,3 +40,16 @@ def test_normalize_sex_no_sex_id():
     df = pd.DataFrame({"ColumnA": [1, 2, 3], "ColumnB": [1, 2, 3]})
     normalized = utilities.normalize_sex(df, fill_value=0.0, cols_to_fill=["value"])
     pd.testing.assert_frame_equal(df, normalized)
+
+
+def test_normalize_age_all_ages(mocker):
+    age_group_ids = [2, 3, 4]
+    mocker.patch(
+        "vivarium_inputs.utilities.utility_data.get_age_group_ids", return_value=age_group_ids
+    )
+    values = [1, 2]
+    df = pd.DataFrame({"sex_id": [1, 2], "age_group_id": [22, 22], "value": values})
+    normalized = utilities.normalize_age(df, fill_value=0.0, cols_to_fill=["value"])
+    assert set(normalized.age_group_id) == set(age_group_ids)
+    for age in age_group_ids:
+        assert (normalized.loc[normalized.age_group_id == age, "value"] == values).all()
@@ -490,3 +490,35 @@ def test_check_metric_id_fail(m_ids, expected, metrics_mock):
 def test_check_metric_id_pass(m_ids, expected, metrics_mock):
     df = pd.DataFrame({"metric_id": m_ids})
     raw.check_metric_id(df, expected)
+
+
+def test__get_non_trivial_age_groups_categorical(mocker, mock_validation_context):
+    mock_validation_context["relative_risk"] = pd.DataFrame(
+        {
+            "cause_id": [1, 1, 1],
+            "age_group_id": [2, 3, 388],
+            "draw_0": [1.0, 1.0, 1.5],
+            "draw_1": [1.0, 1.2, 1.0],
+        }
+    )
+    entity = mocker.Mock(distribution="dichotomous")
+
+    assert raw._get_non_trivial_age_groups(mock_validation_context, entity) == {3, 388}
+
+
+@pytest.mark.parametrize("inverted, expected", [(False, {388}), (True, {2, 388})])
+def test__get_non_trivial_age_groups_continuous(
+    mocker, mock_validation_context, inverted, expected
+):
+    mock_validation_context["exposure"] = pd.DataFrame(
+        {
+            "location_id": [1, 1, 1],
+            "age_group_id": [2, 3, 388],
+            "draw_0": [1.0, 3.0, 2.0],
+            "draw_1": [2.0, 3.0, 5.0],
+        }
+    )
+    entity = mocker.Mock(distribution="normal")
+    entity.tmred = mocker.Mock(distribution="uniform", min=2.0, max=4.0, inverted=inverted)
+
+    assert raw._get_non_trivial_age_groups(mock_validation_context, entity) == expected
@@ -3,7 +3,7 @@ import pandas as pd
 import pytest
 
 from tests.extract.check import RUNNING_ON_CI
-from vivarium_inputs.globals import DataTransformationError
+from vivarium_inputs.globals import DRAW_COLUMNS, DataTransformationError
 from vivarium_inputs.validation import sim
 
 
@@ -289,3 +289,71 @@ def test_validate_expected_columns_fail(df):
         sim.validate_expected_index_and_columns(
             cols[:1], data.index.names, cols[:2], data.columns
         )
+
+
+def _covariate_data(values):
+    index = pd.MultiIndex.from_product(
+        [[1990, 1991], ["lower_value", "mean_value", "upper_value"]],
+        names=["year", "parameter"],
+    )
+    return pd.DataFrame({"value": values}, index=index)
+
+
+@pytest.mark.parametrize(
+    "values",
+    [[0.1, 0.2, 0.3, 0.0, 0.0, 0.0], [0.1, 0.2, 0.3, 0.2, 0.2, 0.2]],
+)
+def test_check_covariate_values_pass(values):
+    sim.check_covariate_values(_covariate_data(values))
+
+
+@pytest.mark.parametrize("values", [[0.1, 0.2, 0.3, 0.3, 0.2, 0.1]])
+def test_check_covariate_values_fail(values):
+    with pytest.raises(DataTransformationError, match="lower <= mean <= upper"):
+        sim.check_covariate_values(_covariate_data(values))
+
+
+def _excess_mortality_rate_inputs(mocker, context, china_value, kenya_value):
+    for check in [
+        "validate_standard_columns",
+        "check_age_restrictions",
+        "check_sex_restrictions",
+    ]:
+        mocker.patch(f"vivarium_inputs.validation.sim.{check}")
+    context["location"] = ["China", "Kenya"]
+    entity = mocker.Mock()
+    entity.name = "subarachnoid_hemorrhage"
+
+    age = pd.Interval(0, 1, closed="left")
+    year = pd.Interval(2019, 2020, closed="left")
+    index = pd.MultiIndex.from_tuples(
+        [("China", "Male", age, year), ("Kenya", "Male", age, year)],
+        names=["location", "sex", "age", "year"],
+    )
+    data = pd.DataFrame({c: [china_value, kenya_value] for c in DRAW_COLUMNS}, index=index)
+    return data, entity
+
+
+@pytest.mark.parametrize("china_value, kenya_value", [(1_000.0, 100.0), (3_775.0, 300.0)])
+def test_validate_excess_mortality_rate_location_caps_pass(
+    mocker, mock_validation_context, china_value, kenya_value
+):
+    data, entity = _excess_mortality_rate_inputs(
+        mocker, mock_validation_context, china_value, kenya_value
+    )
+    sim.validate_excess_mortality_rate(data, entity, mock_validation_context)
+
+
+@pytest.mark.parametrize(
+    "china_value, kenya_value",
+    [(4_000.0, 100.0), (100.0, 1_000.0)],
+    ids=("china_over_own_cap", "kenya_over_default_cap"),
+)
+def test_validate_excess_mortality_rate_location_caps_fail(
+    mocker, mock_validation_context, china_value, kenya_value
+):
+    data, entity = _excess_mortality_rate_inputs(
+        mocker, mock_validation_context, china_value, kenya_value
+    )
+    with pytest.raises(DataTransformationError, match="above"):
+        sim.validate_excess_mortality_rate(data, entity, mock_validation_context)